@@ -6,25 +6,47 @@ and process media player cover images for display devices.
 """
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import os
-import aiohttp
+import tempfile
+from urllib.parse import parse_qs, urlsplit
 import voluptuous as vol
 from PIL import Image
 from io import BytesIO
 import json
 
-from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.storage import Store
 from homeassistant.components.frontend import async_get_translations
 
-from .const import DOMAIN, STORAGE_KEY, STORAGE_VERSION, SENSOR_ENTITY_ID, TRANSLATION_CATEGORIES, COVER_SIZES
+from .const import DOMAIN, STORAGE_KEY, STORAGE_VERSION, STORAGE_SAVE_DELAY, SENSOR_ENTITY_ID, TRANSLATION_CATEGORIES, TRANSLATION_CATEGORIES_SET, COVER_SIZES
 
 _LOGGER = logging.getLogger(__name__)
 
+# Общий компактный JSON-энкодер для атрибутов сенсора
+_JSON_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+# Неизменяемая часть атрибутов сенсора
+_BASE_ATTRIBUTES = {
+    "friendly_name": "Display Tools",
+    "icon": "mdi:monitor-dashboard",
+    "available_categories": TRANSLATION_CATEGORIES,
+    "available_cover_sizes": tuple(COVER_SIZES),
+}
+
+# Прокси обложек медиаплеера в Home Assistant
+_MEDIA_PLAYER_PROXY_PATH = "/api/media_player_proxy/"
+
+# Куда сохраняется обработанная обложка
+_COVER_DIR = "/config/www/display_tools"
+
 # Schema for get_raw_translations service
 GET_RAW_TRANSLATIONS_SCHEMA = vol.Schema({
     vol.Required('language'): cv.string,
@@ -33,14 +55,14 @@ GET_RAW_TRANSLATIONS_SCHEMA = vol.Schema({
 # Schema for get_translations service
 GET_TRANSLATIONS_SCHEMA = vol.Schema({
     vol.Required('language'): cv.string,
-    vol.Required('category'): vol.In(TRANSLATION_CATEGORIES),
+    vol.Required('category'): vol.In(TRANSLATION_CATEGORIES_SET),
     vol.Optional('keys'): vol.All(cv.ensure_list, [cv.string]),
 })
 
 # Schema for get_translations_esphome service
 GET_TRANSLATIONS_ESPHOME_SCHEMA = vol.Schema({
     vol.Required('language'): cv.string,
-    vol.Required('category'): vol.In(TRANSLATION_CATEGORIES),
+    vol.Required('category'): vol.In(TRANSLATION_CATEGORIES_SET),
     vol.Optional('keys'): vol.Any(
         vol.All(cv.ensure_list, [cv.string]),
         cv.string,
@@ -52,7 +74,8 @@ GET_TRANSLATIONS_ESPHOME_SCHEMA = vol.Schema({
 # Schema for save_media_cover service
 SAVE_MEDIA_COVER_SCHEMA = vol.Schema({
     vol.Required('entity_id'): cv.entity_id,
-    vol.Required('size'): vol.In(['small', 'large']),
+    # Preset name is resolved to a (width, height) tuple
+    vol.Required('size'): vol.All(vol.In(COVER_SIZES), COVER_SIZES.get),
 })
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -63,6 +86,10 @@ async def _fetch_translations_for_category(hass: HomeAssistant, language: str, c
     """
     Fetch all translations for a specific category and language.
     
+    Results are cached in hass.data[DOMAIN]["raw_trans_cache"] until the core
+    config changes or a new component is loaded. The cached dict is returned
+    as is and must not be mutated by callers.
+    
     Args:
         hass: Home Assistant instance
         language (str): Language code (e.g., 'ru', 'en')
@@ -71,14 +98,20 @@ async def _fetch_translations_for_category(hass: HomeAssistant, language: str, c
     Returns:
         dict: All translations for the category
     """
+    cache = hass.data[DOMAIN]["raw_trans_cache"]
+    cached = cache.get(language, {}).get(category)
+    if cached is not None:
+        return cached
+    
     try:
         translations = await async_get_translations(hass, language, category)
+        cache.setdefault(language, {})[category] = translations
         return translations
     except Exception as e:
         _LOGGER.error(f"Error fetching translations for {language}.{category}: {e}")
         return {}
 
-async def _filter_translations_by_keys(translations: dict, keys: list[str]) -> dict:
+def _filter_translations_by_keys(translations: dict, keys: list[str]) -> dict:
     """
     Filter translations dictionary by specific keys.
     
@@ -92,23 +125,103 @@ async def _filter_translations_by_keys(translations: dict, keys: list[str]) -> d
     if not keys:
         return translations
     
-    filtered = {}
-    for key in keys:
-        if key in translations:
-            filtered[key] = translations[key]
-        else:
-            filtered[key] = key  # Fallback to key itself
+    # Fallback to key itself
+    return {key: translations.get(key, key) for key in keys}
+
+async def _fetch_local_image(hass: HomeAssistant, entity_id: str) -> bytes | None:
+    """
+    Fetch media player image bytes directly from Home Assistant without an HTTP round-trip.
+    
+    Args:
+        hass: Home Assistant instance
+        entity_id (str): Media player entity ID
+        
+    Returns:
+        bytes | None: Image data, or None if it can't be fetched in-process
+    """
+    try:
+        component = hass.data.get('media_player')
+        entity = component.get_entity(entity_id) if component else None
+        if entity is None:
+            return None
+        image_data, _ = await entity.async_get_media_image()
+        return image_data
+    except Exception as e:
+        _LOGGER.debug(f"In-process image fetch failed for {entity_id}, falling back to HTTP: {e}")
+    
+    return None
+
+def _process_image_sync(image_file, target_size: tuple[int, int], output_path: str) -> None:
+    """
+    Resize a cover image to the target size and save it as JPEG.
+    
+    Runs in the executor: decoding, resampling and writing are blocking.
+    
+    Args:
+        image_file: File-like object with the source image data
+        target_size (tuple): Output (width, height)
+        output_path (str): Where to save the JPEG
+    """
+    # Открываем изображение
+    img = Image.open(image_file)
+    
+    # Для JPEG декодируем сразу в уменьшенном масштабе (1/2, 1/4, 1/8)
+    img.draft('RGB', target_size)
+    
+    # Палитру и RGBA конвертируем в RGB до уменьшения (для JPEG)
+    if img.mode in ('RGBA', 'P'):
+        img = img.convert('RGB')
+    
+    # Изменяем размер с сохранением пропорций (без увеличения, как thumbnail)
+    target_width, target_height = target_size
+    scale = min(target_width / img.width, target_height / img.height, 1)
+    new_width = max(1, round(img.width * scale))
+    new_height = max(1, round(img.height * scale))
+    # reducing_gap включает быстрое предварительное уменьшение (как в thumbnail)
+    resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
     
-    return filtered
+    # Остальные режимы (L, CMYK, ...) дешевле конвертировать уже после уменьшения
+    if resized.mode != 'RGB':
+        resized = resized.convert('RGB')
+    
+    if resized.size == target_size:
+        # Квадратный источник уже заполняет весь кадр - холст не нужен
+        new_img = resized
+    else:
+        # Создаем новое изображение с точными размерами и центрируем
+        new_img = Image.new('RGB', target_size, (0, 0, 0))
+        
+        # Вычисляем позицию для центрирования
+        x = (target_width - new_width) // 2
+        y = (target_height - new_height) // 2
+        
+        # Вставляем изображение по центру
+        new_img.paste(resized, (x, y))
+    
+    # Создаем директорию если не существует
+    os.makedirs(_COVER_DIR, exist_ok=True)
+    
+    # Сохраняем во временный файл и атомарно подменяем, чтобы устройство не прочитало недописанный JPEG
+    fd, tmp_path = tempfile.mkstemp(dir=_COVER_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            new_img.save(tmp_file, "JPEG", quality=85)
+        # mkstemp создает файл с правами 0600, возвращаем обычные права на чтение
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
 
-async def _download_and_process_cover(hass: HomeAssistant, entity_id: str, size: str) -> bool:
+async def _download_and_process_cover(hass: HomeAssistant, entity_id: str, target_size: tuple[int, int]) -> bool:
     """
     Download and process media player cover image.
     
     Args:
         hass: Home Assistant instance
         entity_id (str): Media player entity ID
-        size (str): Size preset ('small' or 'large')
+        target_size (tuple): Output (width, height), resolved from the size preset by the schema
         
     Returns:
         bool: True if successful, False otherwise
@@ -126,61 +239,76 @@ async def _download_and_process_cover(hass: HomeAssistant, entity_id: str, size:
             _LOGGER.error(f"No entity_picture found for {entity_id}")
             return False
         
-        # Формируем полный URL если это относительный путь
-        if entity_picture.startswith('/'):
-            base_url = f"http://localhost:{hass.http.server_port}"
-            image_url = f"{base_url}{entity_picture}"
-        else:
-            image_url = entity_picture
+        output_path = os.path.join(_COVER_DIR, "cover.jpeg")
         
-        # Получаем размеры для обработки
-        target_size = COVER_SIZES[size]
+        # Обложка уже сохранена для этого же URL и размера (и файл на месте)?
+        cover_cache = hass.data[DOMAIN].get("cover_cache")
+        cached = cover_cache if cover_cache and cover_cache["key"] == (entity_picture, target_size) else None
+        if cached and not await hass.async_add_executor_job(os.path.isfile, output_path):
+            cached = None
+        
+        # URL прокси с параметром cache= содержит хеш изображения, поэтому тот же URL - та же обложка
+        if cached and entity_picture.startswith('/') and 'cache' in parse_qs(urlsplit(entity_picture).query):
+            _LOGGER.debug(f"Cover for {entity_id} is unchanged, skipping processing")
+            return True
         
-        # Скачиваем изображение
-        async with aiohttp.ClientSession() as session:
-            async with session.get(image_url) as response:
+        etag = None
+        last_modified = None
+        
+        # Прокси медиаплеера Home Assistant - берем изображение напрямую у сущности из URL
+        # (она может отличаться от entity_id, например у universal media player)
+        image_data = None
+        if entity_picture.startswith(_MEDIA_PLAYER_PROXY_PATH):
+            proxy_entity_id = urlsplit(entity_picture).path.split('/')[3]
+            image_data = await _fetch_local_image(hass, proxy_entity_id)
+        
+        if image_data is None:
+            # Формируем полный URL если это относительный путь
+            if entity_picture.startswith('/'):
+                base_url = f"http://localhost:{hass.http.server_port}"
+                image_url = f"{base_url}{entity_picture}"
+            else:
+                image_url = entity_picture
+            
+            # Скачиваем изображение через общую сессию Home Assistant (keep-alive между вызовами)
+            headers = {}
+            if cached:
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            
+            session = async_get_clientsession(hass)
+            async with session.get(image_url, headers=headers) as response:
+                if response.status == 304:
+                    _LOGGER.debug(f"Cover for {entity_id} is not modified, skipping processing")
+                    return True
+                
                 if response.status != 200:
                     _LOGGER.error(f"Failed to download image from {image_url}, status: {response.status}")
                     return False
                 
                 image_data = await response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
         
-        # Обрабатываем изображение с помощью PIL
+        # Обрабатываем изображение с помощью PIL в executor, чтобы не блокировать event loop
         try:
-            # Открываем изображение
-            img = Image.open(BytesIO(image_data))
-            
-            # Конвертируем в RGB если необходимо (для JPEG)
-            if img.mode in ('RGBA', 'P'):
-                img = img.convert('RGB')
-            
-            # Изменяем размер с сохранением пропорций
-            img.thumbnail(target_size, Image.Resampling.LANCZOS)
-            
-            # Создаем новое изображение с точными размерами и центрируем
-            new_img = Image.new('RGB', target_size, (0, 0, 0))
-            
-            # Вычисляем позицию для центрирования
-            x = (target_size[0] - img.width) // 2
-            y = (target_size[1] - img.height) // 2
-            
-            # Вставляем изображение по центру
-            new_img.paste(img, (x, y))
-            
-            # Создаем директорию если не существует
-            output_dir = "/config/www/display_tools"
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Сохраняем изображение
-            output_path = os.path.join(output_dir, "cover.jpeg")
-            new_img.save(output_path, "JPEG", quality=85)
-            
-            _LOGGER.info(f"Successfully saved cover image to {output_path} with size {target_size}")
-            return True
+            await hass.async_add_executor_job(_process_image_sync, BytesIO(image_data), target_size, output_path)
             
         except Exception as e:
             _LOGGER.error(f"Error processing image: {e}")
             return False
+        
+        # Запоминаем источник сохраненной обложки
+        hass.data[DOMAIN]["cover_cache"] = {
+            "key": (entity_picture, target_size),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        
+        _LOGGER.info(f"Successfully saved cover image to {output_path} with size {target_size}")
+        return True
             
     except Exception as e:
         _LOGGER.error(f"Error in _download_and_process_cover: {e}")
@@ -195,21 +323,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Initialize hass.data
     hass.data[DOMAIN] = {
         "store": store,
+        "cover_cache": None,
+        "raw_trans_cache": {},
+        "attr_cache": {},
+        "cover_lock": asyncio.Lock(),
+        "stored_dirty": False,
     }
+    domain_data = hass.data[DOMAIN]
     
-    # Загружаем сохраненные данные
+    @callback
+    def _stored_data_to_save() -> dict:
+        """Return stored data for the delayed save and mark it as written."""
+        domain_data["stored_dirty"] = False
+        return domain_data["stored"]
+    
+    @callback
+    def _async_clear_translations_cache(event: Event) -> None:
+        """Drop cached translations when they may have changed."""
+        hass.data[DOMAIN]["raw_trans_cache"].clear()
+        hass.data[DOMAIN]["attr_cache"].clear()
+    
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, _async_clear_translations_cache)
+    )
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_COMPONENT_LOADED, _async_clear_translations_cache)
+    )
+    
+    # Загружаем сохраненные данные и держим их копию в памяти
     stored_data = await store.async_load()
+    hass.data[DOMAIN]["stored"] = stored_data or {}
     
     if stored_data:
         # Восстанавливаем сенсор с сохраненными данными
         attributes = {
-            "friendly_name": "Display Tools",
-            "icon": "mdi:monitor-dashboard",
+            **_BASE_ATTRIBUTES,
             "language": stored_data.get("language", "unknown"),
             "category": stored_data.get("category", "unknown"),
             "translations_count": stored_data.get("translations_count", 0),
-            "available_categories": TRANSLATION_CATEGORIES,
-            "available_cover_sizes": list(COVER_SIZES.keys()),
             "requested_keys_count": stored_data.get("requested_keys_count", 0),
         }
         
@@ -217,7 +368,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         grouped_translations = stored_data.get("grouped_translations", {})
         for component, component_translations in grouped_translations.items():
             # Сохраняем как JSON строку для ESPHome
-            attributes[component] = json.dumps(component_translations, ensure_ascii=False)
+            attributes[component] = _JSON_ENCODE(component_translations)
         
         hass.states.async_set(
             SENSOR_ENTITY_ID,
@@ -231,12 +382,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.states.async_set(
             SENSOR_ENTITY_ID,
             "empty",
-            {
-                "friendly_name": "Display Tools",
-                "icon": "mdi:monitor-dashboard",
-                "available_categories": TRANSLATION_CATEGORIES,
-                "available_cover_sizes": list(COVER_SIZES.keys()),
-            }
+            dict(_BASE_ATTRIBUTES)
         )
     
     async def handle_get_raw_translations(call: ServiceCall) -> ServiceResponse:
@@ -246,11 +392,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         try:
             result = {}
             
-            # Получаем переводы для всех категорий
-            for category in TRANSLATION_CATEGORIES:
-                translations = await _fetch_translations_for_category(hass, language, category)
+            # Получаем переводы для всех категорий параллельно
+            all_translations = await asyncio.gather(*(
+                _fetch_translations_for_category(hass, language, category)
+                for category in TRANSLATION_CATEGORIES
+            ))
+            for category, translations in zip(TRANSLATION_CATEGORIES, all_translations):
                 if translations:
-                    result[category] = translations
+                    # Копия, чтобы изменение ответа не портило кеш
+                    result[category] = dict(translations)
             
             return {
                 "language": language,
@@ -276,9 +426,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             # Получаем все переводы для категории
             translations = await _fetch_translations_for_category(hass, language, category)
             
-            # Фильтруем по ключам если указаны
+            # Фильтруем по ключам если указаны, иначе отдаем копию, чтобы изменение ответа не портило кеш
             if keys:
-                translations = await _filter_translations_by_keys(translations, keys)
+                translations = _filter_translations_by_keys(translations, keys)
+            else:
+                translations = dict(translations)
             
             return {
                 "language": language,
@@ -343,57 +495,72 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         
         try:
             # Получаем все переводы для категории
-            translations = await _fetch_translations_for_category(hass, language, category)
+            source_translations = await _fetch_translations_for_category(hass, language, category)
             
-            # Фильтруем по ключам если указаны
-            if keys:
-                translations = await _filter_translations_by_keys(translations, keys)
+            # Тот же запрос по тем же исходным переводам - берем готовые группы и JSON строки.
+            # Храним только последний запрос для каждой пары (язык, категория), чтобы кеш не рос
+            attr_cache = hass.data[DOMAIN]["attr_cache"]
+            cache_key = (language, category)
+            requested_keys = tuple(keys) if keys else None
+            cached = attr_cache.get(cache_key)
             
-            # Группируем переводы по компонентам
-            grouped_translations = {}
-            for key, value in translations.items():
-                # Извлекаем компонент из ключа (например, vacuum из component.vacuum.entity_component._.state.cleaning)
-                parts = key.split('.')
-                if len(parts) >= 2 and parts[0] == 'component':
-                    component = parts[1]  # vacuum, cover, climate, weather
+            if cached and cached[0] is source_translations and cached[1] == requested_keys:
+                _, _, translations_count, grouped_translations, component_attributes = cached
+            else:
+                translations = source_translations
+                
+                # Фильтруем по ключам если указаны
+                if keys:
+                    translations = _filter_translations_by_keys(translations, keys)
+                
+                # Группируем переводы по компонентам
+                grouped_translations = {}
+                for key, value in translations.items():
+                    if not key.startswith('component.'):
+                        continue
+                    # Извлекаем компонент из ключа (например, vacuum из component.vacuum.entity_component._.state.cleaning)
+                    component = key.split('.', 2)[1]  # vacuum, cover, climate, weather
                     # Извлекаем последнюю часть как ключ (cleaning, opening, heating, etc.)
-                    final_key = parts[-1]
+                    final_key = key.rpartition('.')[2]
                     
-                    if component not in grouped_translations:
-                        grouped_translations[component] = {}
-                    grouped_translations[component][final_key] = value
+                    grouped_translations.setdefault(component, {})[final_key] = value
+                
+                # Сериализуем группы как JSON строки для ESPHome
+                translations_count = len(translations)
+                component_attributes = {
+                    component: _JSON_ENCODE(component_translations)
+                    for component, component_translations in grouped_translations.items()
+                }
+                attr_cache[cache_key] = (source_translations, requested_keys, translations_count, grouped_translations, component_attributes)
             
             # Получаем текущие данные из хранилища
             store = hass.data[DOMAIN]["store"]
-            stored_data = await store.async_load() or {}
+            stored_data = hass.data[DOMAIN]["stored"]
             
             # Обновляем сохраненные данные
             stored_data.update({
                 "language": language,
                 "category": category,
                 "grouped_translations": grouped_translations,
-                "translations_count": len(translations),
+                "translations_count": translations_count,
                 "requested_keys_count": len(keys) if keys else 0,
             })
             
-            # Сохраняем в хранилище
-            await store.async_save(stored_data)
+            # Сохраняем в хранилище с задержкой, частые вызовы объединяются в одну запись
+            hass.data[DOMAIN]["stored_dirty"] = True
+            store.async_delay_save(_stored_data_to_save, STORAGE_SAVE_DELAY)
             
             # Создаем атрибуты для сенсора
             attributes = {
-                "friendly_name": "Display Tools",
-                "icon": "mdi:monitor-dashboard",
+                **_BASE_ATTRIBUTES,
                 "language": language,
                 "category": category,
-                "translations_count": len(translations),
-                "available_categories": TRANSLATION_CATEGORIES,
-                "available_cover_sizes": list(COVER_SIZES.keys()),
+                "translations_count": translations_count,
                 "requested_keys_count": len(keys) if keys else 0,
             }
             
             # Добавляем группированные переводы как отдельные атрибуты (JSON строки)
-            for component, component_translations in grouped_translations.items():
-                attributes[component] = json.dumps(component_translations, ensure_ascii=False)
+            attributes.update(component_attributes)
             
             # Обновляем сенсор
             hass.states.async_set(
@@ -412,11 +579,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 SENSOR_ENTITY_ID,
                 "error",
                 {
-                    "friendly_name": "Display Tools",
+                    **_BASE_ATTRIBUTES,
                     "icon": "mdi:monitor-off",
                     "error": str(e),
-                    "available_categories": TRANSLATION_CATEGORIES,
-                    "available_cover_sizes": list(COVER_SIZES.keys()),
                 }
             )
     
@@ -428,7 +593,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.info(f"Processing cover for {entity_id} with size {size}")
         
         try:
-            success = await _download_and_process_cover(hass, entity_id, size)
+            # Все вызовы пишут один и тот же cover.jpeg и cover_cache - обрабатываем по одному
+            async with hass.data[DOMAIN]["cover_lock"]:
+                success = await _download_and_process_cover(hass, entity_id, size)
             
             if success:
                 _LOGGER.info(f"Successfully processed cover for {entity_id}")
@@ -474,6 +641,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     
+    # Flush pending delayed save so a reloaded entry restores fresh data
+    data = hass.data[DOMAIN]
+    if data["stored_dirty"]:
+        try:
+            await data["store"].async_save(data["stored"])
+            data["stored_dirty"] = False
+        except Exception as e:
+            _LOGGER.error(f"Error saving Display Tools data on unload: {e}")
+    
     # Remove services
     hass.services.async_remove(DOMAIN, "get_raw_translations")
     hass.services.async_remove(DOMAIN, "get_translations")
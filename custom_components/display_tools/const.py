@@ -3,10 +3,11 @@
 DOMAIN = "display_tools"
 STORAGE_KEY = f"{DOMAIN}.storage"
 STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30  # секунд, объединяет частые записи
 SENSOR_ENTITY_ID = "sensor.display_tools"
 
 # Доступные категории переводов
-TRANSLATION_CATEGORIES = [
+TRANSLATION_CATEGORIES = (
     'title',
     'state', 
     'entity',
@@ -23,7 +24,10 @@ TRANSLATION_CATEGORIES = [
     'issues',
     'selector',
     'services'
-]
+)
+
+# Множество категорий для быстрой проверки в схемах
+TRANSLATION_CATEGORIES_SET = frozenset(TRANSLATION_CATEGORIES)
 
 # Размеры изображений для обложек
 COVER_SIZES = {